@@ -0,0 +1,619 @@
+# -*- coding: utf-8 -*-
+"""XBRL 인스턴스 파싱 (Streamlit 비의존)
+
+대시보드 스크립트(nn.py)와 분리해 두어 spawn 방식 프로세스 풀 작업자가 이 모듈만 import해서 파싱할 수 있다.
+화면 출력(st.*)은 하지 않으며, 결과는 (items, 숫자 태그 수, 매칭된 태그 수, 회사명, 사실 색인) 튜플이다.
+"""
+import io
+import os
+import re
+import codecs
+import mmap
+import zipfile
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+
+# XBRL 스트리밍 파서 (lxml 없으면 BeautifulSoup 경로 사용)
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# ==========================
+# 대용량 XBRL 순차 읽기 (mmap)
+# ==========================
+
+class MappedFileReader:
+    """mmap 위의 순차 리더 - 이미 넘긴 구간은 MADV_DONTNEED로 해제해 파싱 중 페이지 캐시 점유를 일정하게 유지
+
+    (Streamlit 업로드는 원본이 이미 메모리에 있으므로 전체 RSS 상한은 파일 경로 소스에서만 보장된다)
+    """
+    RELEASE_BYTES = 16 * 1024 * 1024  # 이만큼 읽을 때마다 지난 페이지 해제
+
+    def __init__(self, mapped):
+        self.mapped = mapped
+        self.position = 0
+        self.released = 0  # 해제한 구간 끝 (항상 페이지 경계)
+        self.can_release = hasattr(mmap, 'MADV_DONTNEED') and hasattr(mapped, 'madvise')
+
+    def read(self, size=-1):
+        end = len(self.mapped) if size is None or size < 0 else min(self.position + size, len(self.mapped))
+        chunk = self.mapped[self.position:end]
+        self.position = end
+        
+        if self.can_release and self.position - self.released >= self.RELEASE_BYTES:
+            length = (self.position - self.released) // mmap.PAGESIZE * mmap.PAGESIZE
+            self.mapped.madvise(mmap.MADV_DONTNEED, self.released, length)
+            self.released += length
+        return chunk
+
+# ==========================
+# XBRL 사실 색인 (항목 × 기간 × 차원)
+# ==========================
+
+class XBRLFactIndex:
+    """XBRL 사실 색인 - (표준 항목, 기간 키, 차원) → 사실값
+
+    파싱 중에는 (항목, contextRef, unitRef)별로 모으고, 끝에서 context/unit 정의로 풀어 색인한다
+    (정의가 사실보다 뒤에 나와도 됨). 기간 키는 기간형이면 '시작~종료', 시점형이면 '종료일'.
+    원화 금액이 아닌 사실(외화, 주당 금액 등)은 색인하지 않는다.
+    당기 연결 값은 finalize에서 항목별로 미리 골라 두므로 조회는 딕셔너리 1회다.
+    """
+    CONSOLIDATION_AXIS = 'consolidatedandseparatefinancialstatementsaxis'
+    PER_UNIT_PATTERN = re.compile(r'share|per|/', re.IGNORECASE)  # 정의 없는 unitRef의 주당 금액 판별
+
+    def __init__(self):
+        self.contexts = {}   # context id → (기간 키, 차원)
+        self.units = {}      # unit id → 원화 금액 단위 여부
+        self.document_period_end = None  # dei:DocumentPeriodEndDate (보고 기간 종료일)
+        self.facts = {}      # (항목, 기간 키, 차원) → {'value', 'unit', 'decimals', 'context'}
+        self.current = {}    # 항목 → 당기 연결 기준 사실 키
+        self.reporting_end = None  # 당기로 본 종료일
+        self._pending = {}   # (항목, contextRef, unitRef) → 사실 (파싱 중, unit 정의가 뒤에 나올 수 있어 단위별로 보관)
+
+    def add_context(self, context_id, parts):
+        """context 구성요소 (로컬 태그명, dimension 속성, 텍스트) → 기간 키/차원 등록"""
+        start = end = instant = None
+        dims = []
+        for local_name, dimension, text in parts:
+            text = (text or '').strip()
+            if local_name == 'startDate':
+                start = text
+            elif local_name == 'endDate':
+                end = text
+            elif local_name == 'instant':
+                instant = text
+            elif local_name in ('explicitMember', 'typedMember') and dimension:
+                dims.append((dimension, text))
+        
+        if instant:
+            period = instant
+        elif start and end:
+            period = f"{start}~{end}"
+        else:
+            period = None  # forever 또는 기간 없음
+        self.contexts[context_id] = (period, tuple(sorted(dims)))
+
+    def add_unit(self, unit_id, parts):
+        """unit 구성요소 (로컬 태그명, 텍스트) → 원화 금액 단위 여부 등록 (measure가 KRW 하나이고 나눗셈 없음)"""
+        measures = []
+        for local_name, text in parts:
+            if local_name == 'divide':
+                self.units[unit_id] = False
+                return
+            if local_name == 'measure':
+                measures.append((text or '').strip().rpartition(':')[2].upper())
+        self.units[unit_id] = measures == ['KRW']
+
+    def is_krw_amount(self, unit_ref):
+        """unitRef → 원화 금액 여부 (정의된 unit 우선, 정의가 없으면 이름으로 주당 금액만 제외)"""
+        if unit_ref is None:
+            return True  # 단위 정보가 없는 비표준 파일
+        if unit_ref in self.units:
+            return self.units[unit_ref]
+        return not self.PER_UNIT_PATTERN.search(unit_ref)
+
+    @staticmethod
+    def precision(decimals):
+        """decimals 속성 → 정밀도 (INF는 무한대, 없거나 잘못된 값은 가장 낮음)"""
+        if decimals is None:
+            return float('-inf')
+        if decimals.strip().upper() == 'INF':
+            return float('inf')
+        try:
+            return int(decimals)
+        except ValueError:
+            return float('-inf')
+
+    @classmethod
+    def prefer(cls, fact, known):
+        """같은 키의 두 사실 중 fact를 택할지 (같은 금액의 반올림 차이면 정밀한 쪽, 아니면 절댓값 큰 쪽)"""
+        if known is None:
+            return True
+        coarser = min(cls.precision(fact['decimals']), cls.precision(known['decimals']))
+        tolerance = 0.5 * 10 ** -coarser if coarser not in (float('inf'), float('-inf')) else 0
+        if abs(fact['value'] - known['value']) <= tolerance:
+            return cls.precision(fact['decimals']) > cls.precision(known['decimals'])
+        return abs(fact['value']) > abs(known['value'])
+
+    def add_fact(self, item, value, context_ref, unit_ref=None, decimals=None):
+        """사실 하나 추가 (같은 항목·context·unit 안에서는 prefer 기준으로 하나만 유지)"""
+        key = (item, context_ref, unit_ref)
+        fact = {'value': value, 'unit': unit_ref, 'decimals': decimals, 'context': context_ref}
+        if self.prefer(fact, self._pending.get(key)):
+            self._pending[key] = fact
+
+    @staticmethod
+    def period_end(period):
+        """기간 키 → 종료일 (기간 없으면 None)"""
+        return period.rpartition('~')[2] if period else None
+
+    @classmethod
+    def dimension_rank(cls, dims):
+        """차원 → 우선순위 (0 연결, 1 차원 없음, 2 별도, 부문 등 기타 차원은 None)"""
+        if not dims:
+            return 1
+        if len(dims) == 1 and dims[0][0].rpartition(':')[2].lower() == cls.CONSOLIDATION_AXIS:
+            member = dims[0][1].lower()
+            if 'separate' in member:
+                return 2
+            if 'consolidated' in member:
+                return 0
+        return None
+
+    def _reporting_period_end(self):
+        """보고 기간 종료일: DocumentPeriodEndDate, 없으면 기간형 사실이 가장 많이 쓰는 종료일 (동률이면 늦은 날)"""
+        if self.document_period_end:
+            return self.document_period_end
+        
+        periods = [period for _, period, _ in self.facts if period]
+        ends = [self.period_end(period) for period in periods if '~' in period] or [self.period_end(period) for period in periods]
+        counts = {}
+        for end in ends:
+            counts[end] = counts.get(end, 0) + 1
+        return max(counts, key=lambda end: (counts[end], end))
+
+    def finalize(self):
+        """수집한 사실을 (항목, 기간, 차원)으로 색인하고 항목별 당기 연결 값 선택"""
+        for (item, context_ref, unit_ref), fact in self._pending.items():
+            if not self.is_krw_amount(unit_ref):
+                continue
+            period, dims = self.contexts.get(context_ref, (None, ()))
+            key = (item, period, dims)
+            if self.prefer(fact, self.facts.get(key)):
+                self.facts[key] = fact
+        self._pending = {}
+        
+        if not any(period for _, period, _ in self.facts):
+            # context 정보가 없는 파일: 항목별 최대 절댓값 (기존 방식)
+            self.current = {item: (item, period, dims) for item, period, dims in self.facts}
+            return self
+        
+        # 항목별 후보 (연결 > 차원 없음 > 별도, 부문 등 기타 차원 제외)
+        candidates = {}
+        for key in self.facts:
+            item, period, dims = key
+            rank = self.dimension_rank(dims)
+            if period and rank is not None:
+                candidates.setdefault(item, []).append((self.period_end(period), rank, period, key))
+        
+        # 당기 = 보고 기간 종료일, 그 기간 사실이 없는 항목만 보고일 이전 가장 늦은(없으면 이후 가장 이른) 종료일 사용
+        # 같은 종료일에서는 연결 우선, 누적(시작일이 이른) 기간 우선
+        self.reporting_end = reporting_end = self._reporting_period_end()
+        self.current = {}
+        for item, options in candidates.items():
+            same = [option for option in options if option[0] == reporting_end]
+            earlier = [option for option in options if option[0] < reporting_end]
+            if same:
+                pool = same
+            elif earlier:
+                latest = max(option[0] for option in earlier)
+                pool = [option for option in earlier if option[0] == latest]
+            else:
+                earliest = min(option[0] for option in options)
+                pool = [option for option in options if option[0] == earliest]
+            self.current[item] = min(pool, key=lambda option: (option[1], option[2]))[3]
+        return self
+
+    def get(self, item, period=None, dims=()):
+        """항목 값 조회 (period 생략 시 당기 연결 기준), 없으면 None"""
+        key = self.current.get(item) if period is None else (item, period, tuple(dims))
+        fact = self.facts.get(key) if key is not None else None
+        return fact['value'] if fact else None
+
+    def current_items(self):
+        """당기 연결 기준 {항목: 값}"""
+        return {item: self.facts[key]['value'] for item, key in self.current.items()}
+
+    def periods(self):
+        """색인된 기간 키 목록 (종료일 → 기간 키 순)"""
+        return sorted({period for _, period, _ in self.facts if period},
+                      key=lambda period: (self.period_end(period), period))
+
+    def items_for_period(self, period):
+        """기간별 {항목: 값} (차원은 연결 > 차원 없음 > 별도 순으로 선택, 재파싱 없음)"""
+        best = {}
+        for (item, fact_period, dims), fact in self.facts.items():
+            rank = self.dimension_rank(dims)
+            if fact_period != period or rank is None:
+                continue
+            if item not in best or rank < best[item][0]:
+                best[item] = (rank, fact['value'])
+        return {item: value for item, (_, value) in best.items()}
+
+    def to_dict(self):
+        """캐시 저장용 JSON 직렬화 가능 구조"""
+        return {
+            'facts': [[item, period, [list(dim) for dim in dims], fact]
+                      for (item, period, dims), fact in self.facts.items()],
+            'current': {item: [key[1], [list(dim) for dim in key[2]]] for item, key in self.current.items()},
+            'reporting_end': self.reporting_end,
+        }
+
+    @classmethod
+    def from_dict(cls, stored):
+        """to_dict 결과 → 색인 복원"""
+        index = cls()
+        for item, period, dims, fact in stored['facts']:
+            index.facts[(item, period, tuple(tuple(dim) for dim in dims))] = fact
+        for item, (period, dims) in stored['current'].items():
+            index.current[item] = (item, period, tuple(tuple(dim) for dim in dims))
+        index.reporting_end = stored['reporting_end']
+        return index
+
+# ==========================
+# XBRL 파서 (표준 손익 항목 + 회사명 + 사실 색인 추출)
+# ==========================
+
+class XBRLParser:
+    # 더 포괄적한 XBRL 태그 매핑 (정규식 패턴)
+    INCOME_STATEMENT_PATTERNS = {
+        # 매출 관련 (더 광범위한 패턴)
+        r'(revenue|sales|매출|수익|총매출|매출수익|operating.*revenue)(?!.*cost|원가|비용)': '매출액',
+        r'(cost.*revenue|cost.*sales|cost.*goods|매출원가|원가|판매원가|제품매출원가)': '매출원가',
+        
+        # 이익 관련
+        r'(gross.*profit|총이익|매출총이익|총수익)': '매출총이익',
+        r'(operating.*income|operating.*profit|영업이익|영업손익|영업수익)(?!.*비용|expense)': '영업이익',
+        r'(net.*income|net.*profit|당기순이익|순이익|당기.*순손익|net.*earnings)(?!.*loss)': '당기순이익',
+        
+        # 비용 관련 (더 정확한 패턴)
+        r'(selling.*expense|selling.*cost|판매비|판매비용|판매관련비용)': '판매비',
+        r'(administrative.*expense|administrative.*cost|관리비|관리비용|일반관리비)': '관리비',
+        r'(selling.*administrative|판매비.*관리비|판관비|판매.*관리.*비용)': '판관비',
+        r'(employee.*benefit|employee.*cost|wage|salary|인건비|급여|임금)': '인건비',
+        r'(depreciation|amortization|감가상각|상각비|감가상각비)': '감가상각비',
+        
+        # 기타 항목
+        r'(interest.*expense|interest.*cost|이자비용|이자지급)': '이자비용',
+        r'(financial.*cost|금융비용|금융원가)': '금융비용',
+        r'(non.*operating.*income|영업외수익|기타수익)': '영업외수익',
+        r'(non.*operating.*expense|영업외비용|기타비용)': '영업외비용'
+    }
+    
+    # 전체 패턴을 우선순위 순서의 named group 하나로 결합 (m.lastgroup = 처음 매칭된 패턴)
+    STANDARD_ITEM_MATCHER = re.compile(
+        '^(?:' + '|'.join(f'(?=[\\s\\S]*?(?:{pattern}))(?P<p{i}>)'
+                          for i, pattern in enumerate(INCOME_STATEMENT_PATTERNS)) + ')',
+        re.IGNORECASE
+    )
+    STANDARD_ITEM_GROUPS = {f'p{i}': item for i, item in enumerate(INCOME_STATEMENT_PATTERNS.values())}
+    
+    # 회사명 후보 태그 (앞쪽일수록 우선, 같은 태그는 정확 일치 > 부분 일치)
+    COMPANY_NAME_TAGS = [
+        'EntityRegistrantName', 'CompanyName', 'entity', 'registrant',
+        'ReportingEntityName', 'EntityName', 'CorporateName'
+    ]
+    DIGIT_PATTERN = re.compile(r'\d')
+    NAME_TEXT_PATTERN = re.compile(r'[A-Za-z가-힣]')  # 회사명 후보는 문자를 포함해야 함 (숫자 사실값 제외)
+    # xbrli:context / xbrli:unit 하위 요소 (스트리밍 중 정의가 끝날 때까지 해제하지 않음)
+    DEFINITION_PART_TAGS = frozenset([
+        'entity', 'identifier', 'segment', 'scenario', 'explicitMember', 'typedMember',
+        'period', 'startDate', 'endDate', 'instant', 'forever',
+        'measure', 'divide', 'unitNumerator', 'unitDenominator'
+    ])
+    
+    # 인코딩 판별용 (BOM은 긴 것부터 검사: UTF-32 LE BOM이 UTF-16 LE BOM으로 시작)
+    ENCODING_SNIFF_BYTES = 64 * 1024
+    BYTE_ORDER_MARKS = [
+        (codecs.BOM_UTF32_LE, 'utf-32-le'), (codecs.BOM_UTF32_BE, 'utf-32-be'),
+        (codecs.BOM_UTF8, 'utf-8'),
+        (codecs.BOM_UTF16_LE, 'utf-16-le'), (codecs.BOM_UTF16_BE, 'utf-16-be'),
+    ]
+    XML_DECLARATION_PATTERN = re.compile(rb'^\s*<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+    
+    # DART 공시 ZIP 패키지: 인스턴스 문서만 읽고 링크베이스(라벨/표시/계산/정의/참조)와 스키마는 건너뜀
+    ZIP_MAGIC = b'PK\x03\x04'
+    XBRL_LINKBASE_PATTERN = re.compile(r'_(lab|pre|cal|def|ref)(-[a-z]{2})?$', re.IGNORECASE)
+
+    def parse_xbrl_source(self, source):
+        """바이트(일반 모드), 임시 파일 경로(대용량 모드) 또는 (ZIP, 멤버명) → 추출 결과"""
+        if isinstance(source, tuple):
+            return self.parse_xbrl_zip_member(*source)
+        if isinstance(source, str):
+            return self.parse_xbrl_path(source)
+        return self.parse_xbrl_content(source)
+
+    def parse_xbrl_zip_member(self, container, member):
+        """ZIP 패키지의 인스턴스 멤버를 압축 해제 스트림으로 바로 파싱 (디스크에 풀지 않음)"""
+        archive = container if isinstance(container, str) else io.BytesIO(container)
+        with zipfile.ZipFile(archive) as zf:
+            with zf.open(member) as stream:
+                head = stream.read(self.ENCODING_SNIFF_BYTES)
+            encoding = self._detect_encoding(head)
+            
+            if LXML_AVAILABLE:
+                try:
+                    with zf.open(member) as stream:
+                        return self._stream_financial_items(stream, encoding)
+                except Exception:
+                    pass  # 스트리밍 실패 시 BeautifulSoup 경로로 재시도
+            
+            with zf.open(member) as stream:
+                return self._parse_with_soup(stream.read(), encoding)
+
+    def parse_xbrl_path(self, path):
+        """대용량 모드: 파일을 mmap으로 열어 스트리밍 파싱 (파서가 파일 전체를 힙 메모리로 읽지 않음)
+
+        업로드 파일은 Streamlit이 이미 메모리에 들고 있으므로 이 경로가 줄이는 것은 파싱 중 추가 메모리뿐이다.
+        프로세스 RSS 자체를 제한하려면 디스크로 바로 받은 소스(DART 원본 XBRL 다운로드 등)를 써야 한다.
+        lxml이 없거나 스트리밍이 실패하면 파일을 읽어 BeautifulSoup 경로로 처리한다.
+        """
+        if os.path.getsize(path) == 0:
+            return {}, 0, 0, None, XBRLFactIndex()
+        
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            encoding = self._detect_encoding(mapped[:self.ENCODING_SNIFF_BYTES])
+            if LXML_AVAILABLE:
+                try:
+                    return self._stream_financial_items(MappedFileReader(mapped), encoding)
+                except Exception:
+                    pass  # 스트리밍 실패 시 BeautifulSoup 경로로 재시도
+            return self._parse_with_soup(mapped[:], encoding)
+
+    def parse_xbrl_content(self, content):
+        """XBRL 바이트 → (items, 숫자 태그 수, 매칭된 태그 수, 회사명, 사실 색인) (화면 출력 없음, 프로세스 풀에서도 사용)"""
+        # 앞부분 바이트만으로 인코딩 판별 (전체 디코딩 시도 없음)
+        encoding = self._detect_encoding(content[:self.ENCODING_SNIFF_BYTES])
+        
+        if LXML_AVAILABLE:
+            # 원본 바이트를 스트리밍 파싱 (DOM 전체를 만들지 않음)
+            try:
+                return self._stream_financial_items(io.BytesIO(content), encoding)
+            except Exception:
+                pass  # 스트리밍 실패 시 BeautifulSoup 경로로 재시도
+        
+        return self._parse_with_soup(content, encoding)
+
+    def _parse_with_soup(self, content, encoding):
+        """BeautifulSoup DOM 파싱 경로 (lxml 미설치 또는 스트리밍 실패 시)"""
+        # 판별한 인코딩으로 한 번만 디코딩
+        content_str = content.decode(encoding, errors='replace')
+        
+        # XML 파싱 (더 안전한 방식)
+        try:
+            # lxml이 있으면 사용, 없으면 기본 xml 파서 사용
+            soup = BeautifulSoup(content_str, 'lxml-xml')
+            if not soup.find():  # 파싱 실패 시 기본 파서 사용
+                soup = BeautifulSoup(content_str, 'xml')
+        except Exception:
+            soup = BeautifulSoup(content_str, 'html.parser')  # 최후 수단
+        
+        # 재무 데이터 + 회사명 추출 (한 번의 순회)
+        return self._extract_financial_items_optimized(soup)
+
+    @classmethod
+    def _select_zip_instance(cls, container):
+        """ZIP 목록(메타데이터)만 보고 XBRL 인스턴스 멤버 선택 (.xbrl 우선, 없으면 링크베이스가 아닌 .xml)"""
+        archive = container if isinstance(container, str) else io.BytesIO(container)
+        try:
+            with zipfile.ZipFile(archive) as zf:
+                infos = [info for info in zf.infolist() if not info.is_dir()]
+        except zipfile.BadZipFile:
+            raise ValueError("ZIP 파일을 읽을 수 없습니다.")
+        
+        candidates = [info for info in infos if info.filename.lower().endswith('.xbrl')]
+        if not candidates:
+            candidates = [
+                info for info in infos
+                if info.filename.lower().endswith('.xml')
+                and not cls.XBRL_LINKBASE_PATTERN.search(os.path.splitext(os.path.basename(info.filename))[0])
+            ]
+        if not candidates:
+            raise ValueError("ZIP 안에서 XBRL 인스턴스 파일(.xbrl/.xml)을 찾을 수 없습니다.")
+        
+        # 여러 개면 가장 큰 문서를 본 재무제표 인스턴스로 사용
+        return max(candidates, key=lambda info: info.file_size).filename
+
+    @classmethod
+    def _detect_encoding(cls, head):
+        """파일 앞부분 바이트로 인코딩 판별 (BOM → XML 선언 → UTF-8 유효성 → cp949)"""
+        for bom, encoding in cls.BYTE_ORDER_MARKS:
+            if head.startswith(bom):
+                return encoding
+        
+        declared = cls.XML_DECLARATION_PATTERN.match(head)
+        if declared:
+            try:
+                encoding = codecs.lookup(declared.group(1).decode('ascii')).name
+                # EUC-KR 선언 파일도 확장 완성형 글자를 쓰는 경우가 많아 상위 집합인 cp949로 처리
+                return 'cp949' if encoding in ('euc_kr', 'cp949') else encoding
+            except LookupError:
+                pass
+        
+        try:
+            head.decode('utf-8')
+            return 'utf-8'
+        except UnicodeDecodeError as e:
+            # 잘린 멀티바이트 문자가 끝에 걸린 경우는 UTF-8로 판단
+            return 'utf-8' if e.start >= len(head) - 3 else 'cp949'
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _company_name_tag_rank(local_name):
+        """회사명 후보 태그 순위 (작을수록 우선, 후보가 아니면 None)"""
+        lowered = local_name.lower()
+        for i, tag_name in enumerate(XBRLParser.COMPANY_NAME_TAGS):
+            if local_name == tag_name:
+                return 2 * i
+            if tag_name.lower() in lowered:
+                return 2 * i + 1
+        return None
+
+    def _consider_company_name(self, best, tag_name, text):
+        """회사명 후보 태그 검사 → 갱신된 (순위, 회사명) (최우선 후보를 찾은 뒤에는 검사 생략)"""
+        if best[0] == 0:
+            return best
+        rank = self._company_name_tag_rank(tag_name)
+        if (rank is not None and (best[0] is None or rank < best[0])
+                and len(text.strip()) > 1 and self.NAME_TEXT_PATTERN.search(text)):
+            return rank, text.strip()
+        return best
+
+    def _extract_financial_items_optimized(self, soup):
+        """BeautifulSoup DOM 기반 재무 항목 + 회사명 추출 (lxml 미설치 시 사용, 화면 출력 없음)
+
+        Returns: (items, 숫자 태그 수, 매칭된 태그 수, 회사명 또는 None, 사실 색인)
+        """
+        index = XBRLFactIndex()
+        numeric_count = processed_count = 0
+        best_name = (None, None)  # (후보 순위, 회사명)
+        
+        for tag in soup.find_all():
+            local_name = tag.name.rpartition(':')[2] if tag.name else ''
+            if local_name == 'context':
+                index.add_context(tag.get('id'), [
+                    (part.name.rpartition(':')[2], part.get('dimension'), part.get_text())
+                    for part in tag.find_all()
+                ])
+            elif local_name == 'unit':
+                index.add_unit(tag.get('id'), [(part.name.rpartition(':')[2], part.string) for part in tag.find_all()])
+            
+            text = tag.string
+            if text and local_name == 'DocumentPeriodEndDate':
+                index.document_period_end = text.strip()
+            if not text:
+                continue
+            
+            best_name = self._consider_company_name(best_name, tag.name, text)
+            
+            if not self.DIGIT_PATTERN.search(text):
+                continue
+            numeric_count += 1
+            if self._collect_fact(index, text, tag.name or '', tag.attrs):
+                processed_count += 1
+        
+        index.finalize()
+        return index.current_items(), numeric_count, processed_count, best_name[1], index
+
+    def _stream_financial_items(self, source, encoding=None):
+        """lxml iterparse 기반 스트리밍 재무 항목 + 회사명 추출 (화면 출력 없음)
+
+        source는 파일 경로 또는 바이너리 파일 객체이며, encoding은 _detect_encoding 결과(바이트를 그대로 파서에 전달).
+        회사명, context(기간/차원), unit, 보고 기간 종료일도 같은 순회에서 읽고, 처리한 요소는 즉시 정리해 메모리를 일정하게 유지한다.
+        Returns: (items, 숫자 태그 수, 매칭된 태그 수, 회사명 또는 None, 사실 색인)
+        """
+        index = XBRLFactIndex()
+        numeric_count = processed_count = 0
+        best_name = (None, None)  # (후보 순위, 회사명)
+        
+        for _, elem in lxml_etree.iterparse(source, events=('end',), recover=True, encoding=encoding,
+                                            huge_tree=True, remove_comments=True):
+            if not isinstance(elem.tag, str):
+                self._release_element(elem)
+                continue
+            
+            local_name = elem.tag.rpartition('}')[2]
+            text = elem.text
+            if text and len(elem) == 0:
+                if local_name == 'DocumentPeriodEndDate':
+                    index.document_period_end = text.strip()
+                
+                best_name = self._consider_company_name(best_name, local_name, text)
+                
+                if self.DIGIT_PATTERN.search(text):
+                    numeric_count += 1
+                    if self._collect_fact(index, text, local_name, elem.attrib):
+                        processed_count += 1
+            
+            if local_name == 'context':
+                index.add_context(elem.get('id'), [
+                    (part.tag.rpartition('}')[2], part.get('dimension'), ''.join(part.itertext()))
+                    for part in elem.iter() if isinstance(part.tag, str)
+                ])
+            elif local_name == 'unit':
+                index.add_unit(elem.get('id'), [
+                    (part.tag.rpartition('}')[2], part.text)
+                    for part in elem.iter() if isinstance(part.tag, str)
+                ])
+            elif local_name in self.DEFINITION_PART_TAGS:
+                continue  # context/unit 하위 요소는 정의가 끝날 때 읽도록 유지
+            self._release_element(elem)
+        
+        index.finalize()
+        return index.current_items(), numeric_count, processed_count, best_name[1], index
+
+    @staticmethod
+    def _release_element(elem):
+        """처리 완료된 요소와 앞선 형제 요소 해제"""
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    @staticmethod
+    def _parse_fact_value(text):
+        """XBRL 사실값 텍스트 → 숫자 (괄호 음수 처리, 1000 미만 노이즈는 None)"""
+        tag_text = text.strip()
+        try:
+            # 괄호로 둘러싸인 음수 처리
+            if '(' in tag_text and ')' in tag_text:
+                number_str = re.sub(r'[^\d.]', '', tag_text.replace('(', '').replace(')', ''))
+                if not number_str:
+                    return None
+                value = -float(number_str)
+            else:
+                # 일반적인 숫자 추출
+                number_str = re.sub(r'[^\d.-]', '', tag_text)
+                if not number_str or number_str in ['-', '.', '-.']:
+                    return None
+                value = float(number_str)
+        except (ValueError, TypeError):
+            return None
+        
+        # 너무 작은 값은 제외 (노이즈 제거)
+        return value if abs(value) >= 1000 else None
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _match_standard_item(tag_info):
+        """태그 정보 → 표준 항목명 (결합 정규식 1회 매칭, 같은 태그 시그니처는 캐시)"""
+        match = XBRLParser.STANDARD_ITEM_MATCHER.match(tag_info)
+        return XBRLParser.STANDARD_ITEM_GROUPS[match.lastgroup] if match else None
+
+    def _collect_fact(self, index, text, tag_name, attrs):
+        """숫자 태그 하나를 표준 항목으로 사실 색인에 추가 (매칭되면 True)
+
+        태그 정보는 태그명 + 속성값이며, 사실마다 다른 id는 빼서 매칭 캐시 적중률을 유지한다.
+        html.parser 대체 경로는 속성명을 소문자로 바꾸므로 contextRef/unitRef는 둘 다 확인한다.
+        """
+        value = self._parse_fact_value(text)
+        if value is None:
+            return False
+        
+        tag_info = ' '.join([tag_name.lower(), *(str(v).lower() for k, v in attrs.items() if k != 'id')])
+        standard_item = self._match_standard_item(tag_info)
+        if standard_item is None:
+            return False
+        
+        index.add_fact(standard_item, value, attrs.get('contextRef', attrs.get('contextref')),
+                       attrs.get('unitRef', attrs.get('unitref')), attrs.get('decimals'))
+        return True
+
+
+def parse_xbrl_worker(source):
+    """프로세스 풀 작업 함수 (모듈 최상위에 있어야 spawn 작업자가 import 가능) - 파싱 소스 → 추출 결과"""
+    return XBRLParser().parse_xbrl_source(source)